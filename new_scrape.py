@@ -1,6 +1,8 @@
 import streamlit as st
-import requests
-from bs4 import BeautifulSoup
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import httpx
+from bs4 import BeautifulSoup, UnicodeDammit
+from selectolax.lexbor import LexborHTMLParser
 import pandas as pd
 import time
 import re
@@ -8,18 +10,46 @@ from urllib.parse import urljoin, urlparse
 import json
 from datetime import datetime
 import io
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from functools import lru_cache
 
-# Try to import selenium for JavaScript support
+# Check for playwright (JavaScript support) without importing it; it is loaded on first use
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec("playwright") is not None
+
+# Prefer the C-backed lxml parser, fall back to the stdlib parser if missing
 try:
-    from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
-    SELENIUM_AVAILABLE = True
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
 except ImportError:
-    SELENIUM_AVAILABLE = False
+    HTML_PARSER = 'html.parser'
+
+# httpx fills in Accept-Encoding itself, including br when brotli is installed
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5'
+}
+
+@st.cache_resource(show_spinner=False)
+def get_session():
+    """Shared HTTP/2 client so repeated requests reuse pooled, multiplexed connections"""
+    transport = httpx.HTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+    )
+    return httpx.Client(transport=transport, headers=DEFAULT_HEADERS, follow_redirects=True)
+
+SESSION = get_session()
+
+# Patterns used on every page, compiled once at import
+_CARD_RE = re.compile(r"card|item|result")
+_NUM_RE = re.compile(r'(\d+\.?\d*)')
+_DATA_ATTR_RE = re.compile(r'^data-')
+_CLASS_SPLIT_RE = re.compile(r'[.\s]+')
 
 # Streamlit app configuration
 st.set_page_config(
@@ -72,16 +102,16 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Check for JavaScript support
-if not SELENIUM_AVAILABLE:
+if not PLAYWRIGHT_AVAILABLE:
     st.warning("""
     ⚠️ **JavaScript Support Not Available**
     
-    For JavaScript-heavy sites like ESC 365, install Selenium:
+    For JavaScript-heavy sites like ESC 365, install Playwright:
     ```
-    pip install selenium
+    pip install playwright
     ```
     
-    You'll also need ChromeDriver for full JavaScript support.
+    You'll also need its Chromium build: `playwright install chromium`
     """)
 
 # Sidebar configuration
@@ -91,7 +121,7 @@ with st.sidebar:
     # Scraping method
     scrape_method = st.selectbox(
         "Scraping Method:",
-        ["Static HTML (Requests)", "JavaScript (Selenium)"] if SELENIUM_AVAILABLE else ["Static HTML (Requests)"],
+        ["Static HTML (Requests)", "JavaScript (Playwright)"] if PLAYWRIGHT_AVAILABLE else ["Static HTML (Requests)"],
         help="JavaScript method can handle dynamic content but is slower"
     )
     
@@ -104,33 +134,15 @@ with st.sidebar:
     # Request settings
     st.subheader("Request Settings")
     timeout = st.slider("Timeout (seconds)", 5, 60, 20)
-    delay = st.slider("Delay between requests", 1, 10, 3)
+    delay = st.slider(
+        "Delay between requests", 0, 10, 0,
+        help="Seconds to wait between pages when scraping several URLs. 0 fetches static pages in parallel."
+    )
     
-    if scrape_method == "JavaScript (Selenium)" and SELENIUM_AVAILABLE:
+    if scrape_method == "JavaScript (Playwright)" and PLAYWRIGHT_AVAILABLE:
         wait_time = st.slider("Wait for content (seconds)", 5, 30, 10)
         headless = st.checkbox("Run browser in background", value=True)
 
-def setup_selenium_driver(headless=True):
-    """Setup Selenium WebDriver with proper options"""
-    if not SELENIUM_AVAILABLE:
-        return None
-    
-    try:
-        options = Options()
-        if headless:
-            options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-        
-        driver = webdriver.Chrome(options=options)
-        return driver
-    except Exception as e:
-        st.error(f"Failed to setup Chrome driver: {str(e)}")
-        return None
-
 def debug_page_content(soup, url):
     """Debug function to analyze page content"""
     debug_info = []
@@ -140,17 +152,12 @@ def debug_page_content(soup, url):
     debug_info.append(f"Page Title: {title.text if title else 'No title found'}")
     
     # Find all unique classes
-    all_classes = set()
-    for element in soup.find_all(attrs={"class": True}):
-        if isinstance(element["class"], list):
-            all_classes.update(element["class"])
-        else:
-            all_classes.add(element["class"])
+    all_classes = set(chain.from_iterable(element.get("class") or () for element in soup.find_all(class_=True)))
     
     debug_info.append(f"Total unique CSS classes found: {len(all_classes)}")
     
     # Look for common patterns
-    cards = soup.find_all(attrs={"class": re.compile(r"card|item|result")})
+    cards = soup.find_all(attrs={"class": _CARD_RE})
     debug_info.append(f"Card-like elements found: {len(cards)}")
     
     # Check for JavaScript indicators
@@ -158,307 +165,393 @@ def debug_page_content(soup, url):
     debug_info.append(f"Script tags found: {len(scripts)}")
     
     # Look for data attributes
-    data_attrs = soup.find_all(attrs=lambda x: x and any(k.startswith('data-') for k in x.keys()) if isinstance(x, dict) else False)
+    data_attrs = soup.find_all(lambda tag: any(_DATA_ATTR_RE.match(k) for k in tag.attrs))
     debug_info.append(f"Elements with data attributes: {len(data_attrs)}")
     
     return debug_info
 
+def save_page_html(content, debug_info):
+    """Write the raw page bytes to a timestamped file"""
+    with open(f"scraped_page_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.html", 'wb') as f:
+        f.write(content)
+    debug_info.append("HTML saved to file")
+
+@st.cache_data(ttl=300, max_entries=50, show_spinner=False)
+def fetch_page(url, timeout):
+    """Fetch a page's raw bytes, cached so Debug then Scrape on one URL hits the network once"""
+    response = SESSION.get(url, timeout=timeout)
+    # Raise instead of returning so failed responses are never cached
+    response.raise_for_status()
+    return response.content
+
 def scrape_with_requests(url, columns, css_classes):
     """Traditional requests-based scraping with enhanced debugging"""
     debug_info = []
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=timeout)
-        debug_info.append(f"HTTP Status: {response.status_code}")
-        debug_info.append(f"Content Length: {len(response.content)} bytes")
-        
-        if response.status_code != 200:
-            return None, [f"HTTP Error: {response.status_code}"], debug_info
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+        try:
+            content = fetch_page(url, timeout)
+        except httpx.HTTPStatusError as e:
+            return None, [f"HTTP Error: {e.response.status_code}"], debug_info
+        debug_info.append(f"Content Length: {len(content)} bytes")
         
         # Debug page content
         if enable_debug:
+            soup = BeautifulSoup(content, HTML_PARSER)
             debug_info.extend(debug_page_content(soup, url))
         
         # Save HTML if requested
         if save_html:
-            with open(f"scraped_page_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html", 'w', encoding='utf-8') as f:
-                f.write(str(soup))
-            debug_info.append("HTML saved to file")
+            save_page_html(content, debug_info)
         
-        # Extract data
-        data = {col["name"]: [] for col in columns if col["name"]}
-        errors = []
+        return scrape_with_requests_logic(content, url, columns, css_classes, debug_info)
         
-        for col, css_class in zip(columns, css_classes):
-            if not css_class or not col["name"]:
-                continue
-                
-            debug_info.append(f"Looking for: {col['tag']}.{css_class}")
-            
-            # Try multiple selector strategies
-            elements = []
-            
-            # Strategy 1: Exact class match
-            elements = soup.find_all(col["tag"], class_=css_class)
-            debug_info.append(f"  Strategy 1 (exact class): {len(elements)} elements")
-            
-            # Strategy 2: Partial class match if no exact match
-            if not elements and '.' in css_class:
-                class_parts = css_class.split('.')
-                for part in class_parts:
-                    if part:
-                        partial_elements = soup.find_all(col["tag"], class_=re.compile(part))
-                        elements.extend(partial_elements)
-                debug_info.append(f"  Strategy 2 (partial class): {len(elements)} elements")
-            
-            # Strategy 3: CSS selector
-            if not elements:
-                try:
-                    css_selector = f"{col['tag']}.{css_class.replace('.', '.')}"
-                    elements = soup.select(css_selector)
-                    debug_info.append(f"  Strategy 3 (CSS selector): {len(elements)} elements")
-                except Exception as e:
-                    debug_info.append(f"  CSS selector failed: {str(e)}")
-            
-            # Extract text from found elements
-            for element in elements:
-                try:
-                    if col.get("is_link"):
-                        href = element.get('href')
-                        if href:
-                            full_url = urljoin(url, href)
-                            data[col["name"]].append(full_url)
-                        else:
-                            data[col["name"]].append(None)
-                    else:
-                        text = element.get_text(strip=True)
-                        if col.get("as_numeric"):
-                            # Extract numbers
-                            numbers = re.findall(r'\d+\.?\d*', text)
-                            if numbers:
-                                try:
-                                    value = float(numbers[0]) if '.' in numbers[0] else int(numbers[0])
-                                    data[col["name"]].append(value)
-                                except ValueError:
-                                    data[col["name"]].append(text)
-                            else:
-                                data[col["name"]].append(None)
-                        else:
-                            data[col["name"]].append(text)
-                except Exception as e:
-                    errors.append(f"Error extracting from {col['name']}: {str(e)}")
+    except Exception as e:
+        return None, [f"Critical error: {str(e)}"], debug_info
+
+@lru_cache(maxsize=128)
+def build_selectors(tag, css_class):
+    """Build the exact and partial-match CSS selectors for a column once, reused across pages"""
+    # Classes may be separated by dots or by spaces (as copied from a class attribute)
+    class_parts = [part for part in _CLASS_SPLIT_RE.split(css_class.strip()) if part]
+    # Match classes through quoted attribute selectors so names like md:flex or w-1/2 stay valid
+    quoted_parts = [part.replace('\\', '\\\\').replace('"', '\\"') for part in class_parts]
+    css_selector = tag + "".join(f'[class~="{part}"]' for part in quoted_parts)
+    # A partial match only adds anything when there are several classes
+    partial_selector = None
+    if len(class_parts) > 1:
+        partial_selector = ", ".join(f'{tag}[class*="{part}"]' for part in quoted_parts)
+    return css_selector, partial_selector
+
+def scrape_with_requests_logic(content, url, columns, css_classes, debug_info):
+    """Extract the configured columns from raw page HTML"""
+    # Lexbor assumes UTF-8 bytes, so let bs4 sniff the charset (BOM, <meta charset>, etc.) first
+    if isinstance(content, bytes):
+        content = UnicodeDammit(content, is_html=True).unicode_markup or content.decode('utf-8', 'replace')
+    tree = LexborHTMLParser(content)
+    
+    # Extract data
+    data = {col["name"]: [] for col in columns if col["name"]}
+    # Column name -> whether every config feeding it is a numeric text column
+    numeric_columns = {}
+    errors = []
+    
+    for col, css_class in zip(columns, css_classes):
+        if not css_class or not col["name"]:
+            continue
             
-            debug_info.append(f"  Final count for {col['name']}: {len(data[col['name']])}")
-        
-        # Handle empty data
-        if not any(data.values()) or all(len(v) == 0 for v in data.values()):
-            return None, ["No data found with the specified selectors"], debug_info
+        debug_info.append(f"Looking for: {col['tag']}.{css_class}")
         
-        # Align data lengths (fix the max() error)
-        max_length = 0
-        for col_data in data.values():
-            if len(col_data) > max_length:
-                max_length = len(col_data)
+        css_selector, partial_selector = build_selectors(col["tag"], css_class)
         
-        if max_length == 0:
-            return None, ["No data extracted"], debug_info
+        # Strategy 1: Exact match on the tag plus every class
+        elements = []
+        try:
+            elements = tree.css(css_selector)
+            debug_info.append(f"  Strategy 1 (CSS selector): {len(elements)} elements")
+        except Exception as e:
+            debug_info.append(f"  CSS selector failed: {str(e)}")
         
-        # Pad shorter columns
-        for col_name in data:
-            current_length = len(data[col_name])
-            if current_length < max_length:
-                data[col_name].extend([None] * (max_length - current_length))
+        # Strategy 2: Partial class match if no exact match, as one selector group
+        # so the tree is walked once and nodes matching several parts appear once
+        if not elements and partial_selector:
+            try:
+                elements = tree.css(partial_selector)
+                debug_info.append(f"  Strategy 2 (partial class): {len(elements)} elements")
+            except Exception as e:
+                debug_info.append(f"  Partial CSS selector failed: {str(e)}")
         
-        df = pd.DataFrame(data)
-        return df, errors, debug_info
+        # Extract text or links from found elements
+        numeric_columns[col["name"]] = (
+            numeric_columns.get(col["name"], True) and bool(col.get("as_numeric")) and not col.get("is_link")
+        )
+        try:
+            if col.get("is_link"):
+                hrefs = [element.attributes.get('href') for element in elements]
+                data[col["name"]].extend(urljoin(url, href) if href else None for href in hrefs)
+            else:
+                data[col["name"]].extend(element.text(strip=True) for element in elements)
+        except Exception as e:
+            errors.append(f"Error extracting from {col['name']}: {str(e)}")
         
-    except Exception as e:
-        return None, [f"Critical error: {str(e)}"], debug_info
+        debug_info.append(f"  Final count for {col['name']}: {len(data[col['name']])}")
+    
+    # Handle empty data
+    if not any(data.values()):
+        return None, ["No data found with the specified selectors"], debug_info
+    
+    # Series align on their index, so shorter columns are padded with NaN by pandas
+    df = pd.DataFrame({col_name: pd.Series(values) for col_name, values in data.items()})
+    
+    # Pull the first number out of each numeric cell in one vectorized pass per column
+    for col_name, is_numeric in numeric_columns.items():
+        if not is_numeric:
+            continue
+        numbers = df[col_name].str.extract(_NUM_RE, expand=False)
+        df[col_name] = pd.to_numeric(numbers, errors='coerce')
+    
+    return df, errors, debug_info
 
-def scrape_with_selenium(url, columns, css_classes):
-    """Selenium-based scraping for JavaScript content"""
-    debug_info = []
+def scrape_with_playwright(urls, columns, css_classes):
+    """Playwright-based scraping for JavaScript content, one browser for every URL"""
+    if not PLAYWRIGHT_AVAILABLE:
+        return [(None, ["Playwright not available"], []) for _ in urls]
     
-    if not SELENIUM_AVAILABLE:
-        return None, ["Selenium not available"], debug_info
+    from playwright.sync_api import sync_playwright
     
-    driver = None
     try:
-        driver = setup_selenium_driver(headless)
-        if not driver:
-            return None, ["Failed to setup Chrome driver"], debug_info
-        
-        debug_info.append("Chrome driver initialized")
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=headless, args=['--no-sandbox', '--disable-dev-shm-usage'])
+            try:
+                context = browser.new_context(
+                    user_agent=DEFAULT_HEADERS['User-Agent'],
+                    viewport={'width': 1920, 'height': 1080}
+                )
+                results = []
+                for i, page_url in enumerate(urls):
+                    if i and delay:
+                        time.sleep(delay)
+                    results.append(scrape_page_with_playwright(context, page_url, columns, css_classes))
+                return results
+            finally:
+                browser.close()
+    except Exception as e:
+        return [(None, [f"Failed to launch browser: {str(e)}"], []) for _ in urls]
+
+def scrape_page_with_playwright(context, url, columns, css_classes):
+    """Load one page in an existing browser context and extract the columns"""
+    from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+    
+    debug_info = []
+    page = None
+    try:
+        page = context.new_page()
         
-        driver.get(url)
-        debug_info.append(f"Page loaded: {driver.title}")
+        # Only wait for the load event; the selector wait below handles content readiness
+        try:
+            page.goto(url, wait_until='load', timeout=timeout * 1000)
+        except PlaywrightTimeoutError:
+            debug_info.append(f"Page load timed out after {timeout}s, continuing with what has loaded")
+        debug_info.append(f"Page loaded: {page.title()}")
         
-        # Wait for content to load
-        time.sleep(wait_time)
+        # Wait until the first configured selector shows up
+        wait_selector = next(
+            (build_selectors(col["tag"], css_class)[0]
+             for col, css_class in zip(columns, css_classes) if css_class and col["name"]),
+            None
+        )
+        if wait_selector:
+            try:
+                page.wait_for_selector(wait_selector, state='attached', timeout=wait_time * 1000)
+                debug_info.append(f"Content ready: {wait_selector}")
+            except PlaywrightTimeoutError:
+                debug_info.append(f"Timed out after {wait_time}s waiting for {wait_selector}")
+            except PlaywrightError as e:
+                # e.g. a selector the browser rejects; still extract whatever has loaded
+                debug_info.append(f"Could not wait for {wait_selector}: {str(e)}")
         
         # Get page source
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        page_source = page.content()
         
         debug_info.append(f"Page source length: {len(page_source)} characters")
         
+        # Save HTML if requested
+        if save_html:
+            save_page_html(page_source.encode('utf-8'), debug_info)
+        
         # Continue with same extraction logic as requests method
-        return scrape_with_requests_logic(soup, url, columns, css_classes, debug_info)
+        return scrape_with_requests_logic(page_source, url, columns, css_classes, debug_info)
         
     except Exception as e:
-        return None, [f"Selenium error: {str(e)}"], debug_info
+        return None, [f"Playwright error: {str(e)}"], debug_info
     finally:
-        if driver:
-            driver.quit()
+        if page:
+            page.close()
+
+def scrape_urls(urls, columns, css_classes):
+    """Scrape one or more URLs and combine the results into a single table"""
+    if scrape_method == "JavaScript (Playwright)" and PLAYWRIGHT_AVAILABLE:
+        # A single browser per scrape, so pages are loaded one after another
+        results = scrape_with_playwright(urls, columns, css_classes)
+    elif delay and len(urls) > 1:
+        # A delay was asked for, so fetch one page at a time and pause between them
+        results = []
+        for i, page_url in enumerate(urls):
+            if i:
+                time.sleep(delay)
+            results.append(scrape_with_requests(page_url, columns, css_classes))
+    else:
+        # Requests are network-bound, so fan them out over the pooled session.
+        # Workers get this run's context so the cached fetch_page works in them.
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(
+            max_workers=min(10, len(urls)),
+            initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+        ) as executor:
+            results = list(executor.map(lambda page_url: scrape_with_requests(page_url, columns, css_classes), urls))
+    
+    if len(results) == 1:
+        return results[0]
+    
+    frames, errors, debug_info = [], [], []
+    for page_url, (df, page_errors, page_debug) in zip(urls, results):
+        if df is not None:
+            # Pick a label no user column already has; duplicate labels break export and display
+            source_column = "Source URL"
+            while source_column in df.columns:
+                source_column += "_"
+            df.insert(0, source_column, page_url)
+            frames.append(df)
+        errors.extend(f"{page_url}: {error}" for error in page_errors)
+        debug_info.append(f"--- {page_url} ---")
+        debug_info.extend(page_debug)
+    
+    df = pd.concat(frames, ignore_index=True) if frames else None
+    return df, errors, debug_info
 
 # Main interface
 st.subheader("🌐 Target Website")
-url = st.text_input(
-    "Enter URL:", 
+url_input = st.text_area(
+    "Enter URL(s):", 
     value="https://esc365.escardio.org/esc-congress/abstract?text=&docType=All&days&page=5&vue=cards",
-    help="The webpage you want to scrape"
+    help="The webpage you want to scrape - one URL per line to scrape several pages at once"
 )
+urls = [line.strip() for line in url_input.splitlines() if line.strip()]
+url = urls[0] if urls else ""
 
 # Column configuration
 st.subheader("📝 Data Extraction Setup")
 num_columns = st.number_input("Number of columns:", min_value=1, max_value=10, value=1)
 
-columns = []
-css_classes = []
+@st.fragment
+def column_config(num_columns):
+    """Column setup widgets; edits here only rerun this fragment"""
+    for i in range(num_columns):
+        with st.expander(f"Column {i+1} - Configure", expanded=True):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.text_input(f"Column name:", value=f"Author" if i == 0 else f"Column {i+1}", key=f"name_{i}")
+                st.text_input(f"CSS class:", value="search__card__header__author.font-regular" if i == 0 else "", key=f"class_{i}")
+            
+            with col2:
+                st.selectbox(f"HTML tag:", ["div", "span", "a", "p", "h1", "h2", "h3"], key=f"tag_{i}")
+                st.checkbox(f"Extract link", key=f"link_{i}")
+                st.checkbox(f"Convert to number", key=f"numeric_{i}")
 
-for i in range(num_columns):
-    with st.expander(f"Column {i+1} - Configure", expanded=True):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            col_name = st.text_input(f"Column name:", value=f"Author" if i == 0 else f"Column {i+1}", key=f"name_{i}")
-            css_class = st.text_input(f"CSS class:", value="search__card__header__author.font-regular" if i == 0 else "", key=f"class_{i}")
-        
-        with col2:
-            tag_type = st.selectbox(f"HTML tag:", ["div", "span", "a", "p", "h1", "h2", "h3"], key=f"tag_{i}")
-            is_link = st.checkbox(f"Extract link", key=f"link_{i}")
-            as_numeric = st.checkbox(f"Convert to number", key=f"numeric_{i}")
-        
+def get_column_config(num_columns):
+    """Read the column setup back from widget state"""
+    columns = []
+    css_classes = []
+    for i in range(num_columns):
         columns.append({
-            "name": col_name,
-            "tag": tag_type,
-            "is_link": is_link,
-            "as_numeric": as_numeric
+            "name": st.session_state[f"name_{i}"],
+            "tag": st.session_state[f"tag_{i}"],
+            "is_link": st.session_state[f"link_{i}"],
+            "as_numeric": st.session_state[f"numeric_{i}"]
         })
-        css_classes.append(css_class)
-
-# Action buttons
-col_btn1, col_btn2, col_btn3 = st.columns(3)
-with col_btn1:
-    scrape_button = st.button("🚀 Start Scraping", type="primary")
-with col_btn2:
-    debug_button = st.button("🐛 Debug Page")
-with col_btn3:
-    clear_button = st.button("🗑️ Clear Results")
-    if clear_button:
-        st.session_state.scraped_data = None
-        st.session_state.debug_info = []
-
-# Debug page structure
-if debug_button and url:
-    with st.spinner("Analyzing page structure..."):
-        try:
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            st.subheader("🔍 Page Analysis")
+        css_classes.append(st.session_state[f"class_{i}"])
+    return columns, css_classes
+
+@st.fragment
+def scraper_actions(urls, url, num_columns):
+    """Action buttons and their results; clicks only rerun this fragment"""
+    # Action buttons
+    col_btn1, col_btn2, col_btn3 = st.columns(3)
+    with col_btn1:
+        scrape_button = st.button("🚀 Start Scraping", type="primary")
+    with col_btn2:
+        debug_button = st.button("🐛 Debug Page")
+    with col_btn3:
+        clear_button = st.button("🗑️ Clear Results")
+        if clear_button:
+            st.session_state.scraped_data = None
+            st.session_state.debug_info = []
+            fetch_page.clear()
+
+    # Debug page structure
+    if debug_button and url:
+        with st.spinner("Analyzing page structure..."):
+            try:
+                content = fetch_page(url, timeout)
+                soup = BeautifulSoup(content, HTML_PARSER)
+                
+                st.subheader("🔍 Page Analysis")
+                
+                # Show page source preview
+                if show_page_source:
+                    st.text_area("Page Source (first 2000 chars):", str(soup)[:2000], height=200)
+                
+                # Debug information
+                debug_results = debug_page_content(soup, url)
+                for info in debug_results:
+                    st.write(f"• {info}")
+                
+                # Show common classes
+                all_classes = set(chain.from_iterable(element.get("class") or () for element in soup.find_all(class_=True)))
+                
+                if all_classes:
+                    st.subheader("🎯 Found CSS Classes")
+                    classes_list = sorted(list(all_classes))
+                    for i in range(0, len(classes_list), 3):
+                        cols = st.columns(3)
+                        for j, col in enumerate(cols):
+                            if i + j < len(classes_list):
+                                col.code(classes_list[i + j])
+                else:
+                    st.warning("No CSS classes found - this might be a JavaScript-heavy site")
+                    
+            except Exception as e:
+                st.error(f"Debug failed: {str(e)}")
+
+    # Main scraping logic
+    columns, css_classes = get_column_config(num_columns)
+    if scrape_button and urls and any(col["name"] for col in columns):
+        with st.spinner("🕷️ Scraping in progress..."):
+            df, errors, debug_info = scrape_urls(urls, columns, css_classes)
             
-            # Show page source preview
-            if show_page_source:
-                st.text_area("Page Source (first 2000 chars):", str(soup)[:2000], height=200)
+            # Store debug info
+            st.session_state.debug_info = debug_info
             
-            # Debug information
-            debug_results = debug_page_content(soup, url)
-            for info in debug_results:
-                st.write(f"• {info}")
+            # Show debug information
+            if enable_debug and debug_info:
+                with st.expander("🐛 Debug Information", expanded=True):
+                    for info in debug_info:
+                        st.write(f"• {info}")
             
-            # Show common classes
-            all_classes = set()
-            for element in soup.find_all(attrs={"class": True}):
-                if isinstance(element["class"], list):
-                    all_classes.update(element["class"])
-                else:
-                    all_classes.add(element["class"])
+            # Show errors
+            if errors:
+                st.error("⚠️ Issues encountered:")
+                for error in errors:
+                    st.write(f"• {error}")
             
-            if all_classes:
-                st.subheader("🎯 Found CSS Classes")
-                classes_list = sorted(list(all_classes))
-                for i in range(0, len(classes_list), 3):
-                    cols = st.columns(3)
-                    for j, col in enumerate(cols):
-                        if i + j < len(classes_list):
-                            col.code(classes_list[i + j])
-            else:
-                st.warning("No CSS classes found - this might be a JavaScript-heavy site")
+            # Show results
+            if df is not None and len(df) > 0:
+                st.session_state.scraped_data = df
+                st.success(f"✅ Successfully scraped {len(df)} rows!")
                 
-        except Exception as e:
-            st.error(f"Debug failed: {str(e)}")
-
-# Main scraping logic
-if scrape_button and url and any(col["name"] for col in columns):
-    with st.spinner("🕷️ Scraping in progress..."):
-        if scrape_method == "JavaScript (Selenium)" and SELENIUM_AVAILABLE:
-            df, errors, debug_info = scrape_with_selenium(url, columns, css_classes)
-        else:
-            df, errors, debug_info = scrape_with_requests(url, columns, css_classes)
-        
-        # Store debug info
-        st.session_state.debug_info = debug_info
-        
-        # Show debug information
-        if enable_debug and debug_info:
-            with st.expander("🐛 Debug Information", expanded=True):
-                for info in debug_info:
-                    st.write(f"• {info}")
-        
-        # Show errors
-        if errors:
-            st.error("⚠️ Issues encountered:")
-            for error in errors:
-                st.write(f"• {error}")
-        
-        # Show results
-        if df is not None and len(df) > 0:
-            st.session_state.scraped_data = df
-            st.success(f"✅ Successfully scraped {len(df)} rows!")
-            
-            # Display data
-            st.subheader("📊 Scraped Data")
-            st.dataframe(df, use_container_width=True)
-            
-            # Export options
-            col_exp1, col_exp2 = st.columns(2)
-            with col_exp1:
-                csv_data = df.to_csv(index=False)
-                st.download_button("📄 Download CSV", csv_data, "scraped_data.csv", "text/csv")
-            with col_exp2:
-                json_data = df.to_json(orient='records', indent=2)
-                st.download_button("📋 Download JSON", json_data, "scraped_data.json", "application/json")
-        else:
-            st.error("❌ No data could be extracted. Check the debug information above.")
-
-# Show previous results if available
-if st.session_state.scraped_data is not None:
-    st.subheader("📊 Current Results")
-    st.dataframe(st.session_state.scraped_data, use_container_width=True)
+                # Display data
+                st.subheader("📊 Scraped Data")
+                st.dataframe(df, use_container_width=True)
+                
+                # Export options
+                col_exp1, col_exp2 = st.columns(2)
+                with col_exp1:
+                    csv_data = df.to_csv(index=False)
+                    st.download_button("📄 Download CSV", csv_data, "scraped_data.csv", "text/csv")
+                with col_exp2:
+                    json_data = df.to_json(orient='records', indent=2)
+                    st.download_button("📋 Download JSON", json_data, "scraped_data.json", "application/json")
+            else:
+                st.error("❌ No data could be extracted. Check the debug information above.")
+
+    # Show previous results if available
+    if st.session_state.scraped_data is not None:
+        st.subheader("📊 Current Results")
+        st.dataframe(st.session_state.scraped_data, use_container_width=True)
+
+column_config(num_columns)
+scraper_actions(urls, url, num_columns)
 
 # Help section
 with st.expander("❓ Troubleshooting ESC 365"):
@@ -466,9 +559,9 @@ with st.expander("❓ Troubleshooting ESC 365"):
     ### Common Issues with ESC 365:
     
     1. **JavaScript Required**: This site loads content dynamically
-       - Use "JavaScript (Selenium)" method
-       - Install: `pip install selenium`
-       - Download ChromeDriver
+       - Use "JavaScript (Playwright)" method
+       - Install: `pip install playwright`
+       - Download Chromium: `playwright install chromium`
     
     2. **CSS Class Issues**: 
        - The class `search__card__header__author.font-regular` might be: